@@ -9,9 +9,32 @@ Classes
 Parser - parses the definition file and builds the logic network.
 """
 import itertools
+from functools import partial
 
 from scanner import Scanner
 
+# Symbol types are bound at module level so that the parsing loops compare
+# against globals rather than looking up a Scanner attribute every time.
+_AND = Scanner.AND
+_NAND = Scanner.NAND
+_OR = Scanner.OR
+_NOR = Scanner.NOR
+_XOR = Scanner.XOR
+_CLOCK = Scanner.CLOCK
+_DTYPE = Scanner.DTYPE
+_SWITCH = Scanner.SWITCH
+_MONITOR = Scanner.MONITOR
+_NAME = Scanner.NAME
+_NUMBER = Scanner.NUMBER
+_DOT = Scanner.DOT
+_COMMA = Scanner.COMMA
+_OPEN = Scanner.OPEN
+_CLOSE = Scanner.CLOSE
+_EQUALS = Scanner.EQUALS
+_INVALID = Scanner.INVALID
+_EOL = Scanner.EOL
+_EOF = Scanner.EOF
+
 class ParsingError(Exception):
   def __init__(self, message, sym=None):
     self.message = message
@@ -49,36 +72,38 @@ class Parser:
     self.__monitors = monitors
     self.__scanner: Scanner = scanner
 
+    self.__dispatch = {
+      _AND: partial(self._parse_gate, devices.AND),
+      _NAND: partial(self._parse_gate, devices.NAND),
+      _OR: partial(self._parse_gate, devices.OR),
+      _NOR: partial(self._parse_gate, devices.NOR),
+      _XOR: partial(self._parse_gate, devices.XOR),
+      _CLOCK: self._parse_CLOCK,
+      _DTYPE: self._parse_DTYPE,
+      _SWITCH: self._parse_SWITCH,
+      _MONITOR: self._parse_monitor,
+    }
+
   def parse_network(self):
     """Parse the circuit definition file."""
+    get_symbol = self.__scanner.get_symbol
+    dispatch = self.__dispatch
     line_count = 1
     try:
       while True:
-        sym = self.__scanner.get_symbol()
-
-        if sym.type == Scanner.EOF:
-          break
+        sym = get_symbol()
 
-        if sym.type == Scanner.AND:
-          self._parse_AND()
-        elif sym.type == Scanner.NAND:
-          self._parse_NAND()
-        elif sym.type == Scanner.OR:
-          self._parse_OR()
-        elif sym.type == Scanner.NOR:
-          self._parse_NOR()
-        elif sym.type == Scanner.XOR:
-          self._parse_XOR()
-        elif sym.type == Scanner.CLOCK:
-          self._parse_CLOCK()
-        elif sym.type == Scanner.DTYPE:
-          self._parse_DTYPE()
-        elif sym.type == Scanner.SWITCH:
-          self._parse_SWITCH()
-        elif sym.type == Scanner.MONITOR:
-          self._parse_monitor()
-        elif sym.type == Scanner.NAME:
+        handler = dispatch.get(sym.type)
+        if handler is not None:
+          handler()
+        elif sym.type == _NAME:
           self._parse_connection(sym)
+        elif sym.type == _EOF:
+          break
+        elif sym.type == _INVALID:
+          raise ParsingError("Unexpected character", sym=sym)
+        elif sym.type != _EOL:
+          raise ParsingError("Unexpected symbol", sym=sym)
 
         line_count += 1
     except ParsingError as e:
@@ -90,26 +115,10 @@ class Parser:
       return False
     return True
 
-  def multiple(parse):
-    def wrapper(self, *args, **kwargs):
-      parse(self, *args, **kwargs)
-
-      while True:
-        sym = self.__scanner.get_symbol()
-        if sym.type == Scanner.EOL:
-          break
-
-        # ,
-        if sym.type != Scanner.COMMA:
-          raise ParsingError("Expecting ','", sym=sym)
-
-        parse(self, *args, **kwargs)
-    return wrapper
-
   def _parse_identifier(self):
     sym = self.__scanner.get_symbol()
-    if sym.type != Scanner.NAME:
-      raise ParsingError(f"Expecting user-defined name", sym=sym)
+    if sym.type != _NAME:
+      raise ParsingError("Expecting user-defined name", sym=sym)
     return sym.id
 
   def _parse_output(self):
@@ -121,201 +130,197 @@ class Parser:
       raise ParsingError("Undeclared device")
 
     if device.device_kind == self.__devices.D_TYPE:
-      self._parse_dot()
+      sym = self.__scanner.get_symbol()
+      if sym.type != _DOT:
+        raise ParsingError("Expecting '.'", sym=sym)
       port_id = self._parse_identifier()
 
     return device_id, port_id
 
-  def _parse_open_bracket(self):
-    sym = self.__scanner.get_symbol()
-    if sym.type != Scanner.OPEN:
-      raise ParsingError("Expecting open bracket", sym=sym)
-
-  def _parse_close_bracket(self):
-    sym = self.__scanner.get_symbol()
-    if sym.type != Scanner.CLOSE:
-      raise ParsingError("Expecting close bracket", sym=sym)
+  def _parse_gate(self, device_kind):
+    get_symbol = self.__scanner.get_symbol
 
-  def _parse_dot(self):
-    sym = self.__scanner.get_symbol()
-    if sym.type != Scanner.DOT:
-      raise ParsingError("Expecting '.'", sym=sym)
+    while True:
+      device_id = self._parse_identifier()
 
-  def _parse_gate(self, **kwargs):
-    device_id = self._parse_identifier()
+      # Default to XOR: 2 inputs
+      no_of_inputs = 2
 
-    # Default to XOR: 2 inputs
-    no_of_inputs = 2
+      if device_kind != self.__devices.XOR:
+        sym = get_symbol()
+        if sym.type != _OPEN:
+          raise ParsingError("Expecting open bracket", sym=sym)
 
-    if kwargs["device_kind"] != self.__devices.XOR:
-      self._parse_open_bracket()
-
-      class InvalidNoOfInputs(ValueError): pass
-      try:
         # no_of_inputs
-        sym = self.__scanner.get_symbol()
-        if sym.type != Scanner.NUMBER:
-          raise InvalidNoOfInputs
-        
-        number = self.__names.get_name_string(sym.id)
-
-        if number[0] == "0":
-          raise InvalidNoOfInputs
+        sym = get_symbol()
+        if sym.type != _NUMBER or sym.leading_zero:
+          raise ParsingError("Expecting a number > 0", sym=sym)
 
-        no_of_inputs = int(number)
+        no_of_inputs = sym.value
 
         if no_of_inputs > 16 or no_of_inputs < 1:
           raise ParsingError("Expecting a number from 1-16", sym=sym)
-      except InvalidNoOfInputs:
-        raise ParsingError("Expecting a number > 0", sym=sym)
 
-      self._parse_close_bracket()
+        sym = get_symbol()
+        if sym.type != _CLOSE:
+          raise ParsingError("Expecting close bracket", sym=sym)
 
-    kwargs.update(dict(device_id=device_id, no_of_inputs=no_of_inputs))
+      self.__devices.make_gate(device_id=device_id, device_kind=device_kind,
+                               no_of_inputs=no_of_inputs)
 
-    self.__devices.make_gate(**kwargs)
+      sym = get_symbol()
+      if sym.type == _EOL:
+        break
 
-  @multiple
-  def _parse_AND(self):
-    self._parse_gate(device_kind=self.__devices.AND)
+      # ,
+      if sym.type != _COMMA:
+        raise ParsingError("Expecting ','", sym=sym)
 
-  @multiple
-  def _parse_OR(self):
-    self._parse_gate(device_kind=self.__devices.OR)
-
-  @multiple
-  def _parse_NAND(self):
-    self._parse_gate(device_kind=self.__devices.NAND)
-
-  @multiple
-  def _parse_NOR(self):
-    self._parse_gate(device_kind=self.__devices.NOR)
-
-  @multiple
-  def _parse_XOR(self):
-    self._parse_gate(device_kind=self.__devices.XOR)
-
-  @multiple
   def _parse_CLOCK(self):
-    device_id = self._parse_identifier()
+    get_symbol = self.__scanner.get_symbol
 
-    self._parse_open_bracket()
+    while True:
+      device_id = self._parse_identifier()
 
-    class InvalidHalfPeriod(ValueError): pass
+      sym = get_symbol()
+      if sym.type != _OPEN:
+        raise ParsingError("Expecting open bracket", sym=sym)
 
-    try:
       # n
-      sym = self.__scanner.get_symbol()
-      if sym.type != Scanner.NUMBER:
-        raise InvalidHalfPeriod
-      
-      name_string = self.__names.get_name_string(sym.id)
-
-      if name_string[0] == "0":
-        raise InvalidHalfPeriod
+      sym = get_symbol()
+      if sym.type != _NUMBER or sym.leading_zero or sym.value < 1:
+        raise ParsingError("Expecting a number > 0", sym=sym)
 
-      clock_half_period = int(name_string)
+      clock_half_period = sym.value
 
-      if clock_half_period < 1:
-        raise InvalidHalfPeriod
+      sym = get_symbol()
+      if sym.type != _CLOSE:
+        raise ParsingError("Expecting close bracket", sym=sym)
 
-    except InvalidHalfPeriod:
-      raise ParsingError("Expecting a number > 0", sym=sym)
+      self.__devices.make_clock(device_id=device_id,
+                                clock_half_period=clock_half_period)
 
-    self._parse_close_bracket()
+      sym = get_symbol()
+      if sym.type == _EOL:
+        break
 
-    self.__devices.make_clock(device_id=device_id, clock_half_period=clock_half_period)
+      # ,
+      if sym.type != _COMMA:
+        raise ParsingError("Expecting ','", sym=sym)
 
-  @multiple
   def _parse_SWITCH(self):
-    device_id = self._parse_identifier()
+    get_symbol = self.__scanner.get_symbol
 
-    self._parse_open_bracket()
+    while True:
+      device_id = self._parse_identifier()
 
-    class InvalidState(ValueError): pass
+      sym = get_symbol()
+      if sym.type != _OPEN:
+        raise ParsingError("Expecting open bracket", sym=sym)
 
-    try:
       # initial state
-      sym = self.__scanner.get_symbol()
-      if sym.type != Scanner.NUMBER:
-        raise InvalidState
-      
-      initial_state = int(self.__names.get_name_string(sym.id))
+      sym = get_symbol()
+      if sym.type != _NUMBER or sym.value not in (0, 1):
+        raise ParsingError("Expecting 0 or 1", sym=sym)
+
+      initial_state = sym.value
 
-      if initial_state not in [0, 1]:
-        raise InvalidState
+      sym = get_symbol()
+      if sym.type != _CLOSE:
+        raise ParsingError("Expecting close bracket", sym=sym)
 
-    except InvalidState:
-      raise ParsingError("Expecting 0 or 1", sym=sym)
+      self.__devices.make_switch(device_id=device_id,
+                                 initial_state=initial_state)
 
-    self._parse_close_bracket()
+      sym = get_symbol()
+      if sym.type == _EOL:
+        break
 
-    self.__devices.make_switch(device_id=device_id,
-                               initial_state=initial_state)
+      # ,
+      if sym.type != _COMMA:
+        raise ParsingError("Expecting ','", sym=sym)
 
-  @multiple
   def _parse_DTYPE(self):
-    device_id = self._parse_identifier()
+    get_symbol = self.__scanner.get_symbol
 
-    self.__devices.make_dtype(device_id=device_id)
+    while True:
+      device_id = self._parse_identifier()
 
-  @multiple
-  def _parse_monitor(self):
-    device_id, output_id = self._parse_output()
+      self.__devices.make_dtype(device_id=device_id)
 
-    error_code = self.__monitors.make_monitor(device_id=device_id,
-                                              output_id=output_id)
+      sym = get_symbol()
+      if sym.type == _EOL:
+        break
 
-    if error_code == self.__network.DEVICE_ABSENT:
-      raise ParsingError("Undeclared device")
-    elif error_code == self.__monitors.NOT_OUTPUT:
-      raise ParsingError("Not monitoring output")
-    elif error_code == self.__monitors.MONITOR_PRESENT:
-      raise ParsingError("Monitor present")
+      # ,
+      if sym.type != _COMMA:
+        raise ParsingError("Expecting ','", sym=sym)
 
-  def _parse_connection(self, sym):
-    args = [sym.id, None, None, None]
+  def _parse_monitor(self):
+    get_symbol = self.__scanner.get_symbol
 
-    def parse_right():
-      # second_device
-      args[2] = self._parse_identifier()
+    while True:
+      device_id, output_id = self._parse_output()
 
-      sym = self.__scanner.get_symbol()
+      error_code = self.__monitors.make_monitor(device_id=device_id,
+                                                output_id=output_id)
 
-      if sym.type == Scanner.EOL:
-        return
+      if error_code == self.__network.DEVICE_ABSENT:
+        raise ParsingError("Undeclared device")
+      elif error_code == self.__monitors.NOT_OUTPUT:
+        raise ParsingError("Not monitoring output")
+      elif error_code == self.__monitors.MONITOR_PRESENT:
+        raise ParsingError("Monitor present")
 
-      if sym.type != Scanner.DOT:
-        raise ParsingError("Expecting '.'", sym=sym)
+      sym = get_symbol()
+      if sym.type == _EOL:
+        break
 
-      # second_port_id
-      args[3] = self._parse_identifier()
+      # ,
+      if sym.type != _COMMA:
+        raise ParsingError("Expecting ','", sym=sym)
 
-      sym = self.__scanner.get_symbol()
-      if sym.type != Scanner.EOL:
-        raise ParsingError("Expecting EOL", sym=sym)
+  def _parse_connection(self, sym):
+    get_symbol = self.__scanner.get_symbol
+    first_device_id = sym.id
+    first_port_id = None
+    second_port_id = None
 
-    sym = self.__scanner.get_symbol()
-    if sym.type == Scanner.EQUALS:
-      parse_right()
-    elif sym.type == Scanner.DOT:
+    sym = get_symbol()
+    if sym.type == _DOT:
       # first_port
-      sym = self.__scanner.get_symbol()
-      if sym.type != Scanner.NAME:
+      sym = get_symbol()
+      if sym.type != _NAME:
         raise ParsingError("Expecting port name", sym=sym)
 
-      args[1] = sym.id
+      first_port_id = sym.id
 
       # =
-      sym = self.__scanner.get_symbol()
-      if sym.type != Scanner.EQUALS:
+      sym = get_symbol()
+      if sym.type != _EQUALS:
         raise ParsingError("Expecting '='", sym=sym)
-
-      parse_right()
-    else:
+    elif sym.type != _EQUALS:
       raise ParsingError("Expecting . or =", sym=sym)
 
-    error_code = self.__network.make_connection(*args)
+    # second_device
+    second_device_id = self._parse_identifier()
+
+    sym = get_symbol()
+    if sym.type != _EOL:
+      if sym.type != _DOT:
+        raise ParsingError("Expecting '.'", sym=sym)
+
+      # second_port_id
+      second_port_id = self._parse_identifier()
+
+      sym = get_symbol()
+      if sym.type != _EOL:
+        raise ParsingError("Expecting EOL", sym=sym)
+
+    error_code = self.__network.make_connection(first_device_id,
+                                                first_port_id,
+                                                second_device_id,
+                                                second_port_id)
 
     if error_code != self.__network.NO_ERROR:
       raise ParsingError("Network error")
\ No newline at end of file
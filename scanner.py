@@ -10,11 +10,32 @@ Symbol - encapsulates a symbol and stores its properties.
 """
 
 import re
-
-
-class Symbol:
+from collections import namedtuple
+
+# m.lastgroup names the kind of token matched. Single-character punctuation
+# shares one PUNCTUATION character class and is told apart by looking the
+# character up in Scanner._PUNCTUATION; keywords are matched as NAME and
+# picked out through Scanner._KEYWORDS.
+# Whitespace is matched but not captured, so m.lastgroup is None for it.
+# Newlines are matched as EOL so that a whole file is scanned in one pass.
+# The nested ZERO group records a leading "0" on a NUMBER.
+TOKEN_RE = re.compile(
+  r"[ \t]+|(?P<EOL>\n)"
+  r"|(?P<PUNCTUATION>[.,()=])"
+  r"|(?P<NUMBER>(?P<ZERO>0)\d*|\d+)|(?P<NAME>[a-z_]\w*)|(?P<INVALID>\S)")
+
+
+class Symbol(namedtuple("Symbol",
+                        ["type", "id", "loc", "value", "leading_zero"],
+                        defaults=[None, None, None, None, False])):
   """Encapsulate a symbol and store its properties.
 
+  Symbols are lightweight tuples of (type, id, loc, value, leading_zero);
+  the fields can be read either by name or by index. NUMBER symbols have no
+  name ID; instead value holds the integer and leading_zero flags a number
+  written with a leading "0", both worked out once by the scanner. Build
+  them positionally: keyword arguments are markedly slower.
+
   Parameters
   ----------
   No parameters.
@@ -24,11 +45,7 @@ class Symbol:
   No public methods.
   """
 
-  def __init__(self, type=None, id=None, loc=None):
-    """Initialise symbol properties."""
-    self.type = type
-    self.id = id
-    self.loc = loc
+  __slots__ = ()
 
 
 class Scanner:
@@ -46,8 +63,7 @@ class Scanner:
 
   Public methods
   -------------
-  get_symbol(self): Translates the next sequence of characters into a symbol
-                    and returns the symbol.
+  get_symbol(self): Returns the next symbol in the definition file.
   """
 
   CLOCK = 0
@@ -74,77 +90,81 @@ class Scanner:
 
   MONITOR = 19
 
+  # Symbol type for each punctuation character matched by TOKEN_RE.
+  _PUNCTUATION = {
+    ".": DOT,
+    ",": COMMA,
+    "(": OPEN,
+    ")": CLOSE,
+    "=": EQUALS,
+  }
+
+  # Symbol type for each reserved word; any other word is a NAME.
+  _KEYWORDS = {
+    "clk": CLOCK,
+    "sw": SWITCH,
+    "and": AND,
+    "or": OR,
+    "nand": NAND,
+    "nor": NOR,
+    "dtype": DTYPE,
+    "xor": XOR,
+    "monitor": MONITOR,
+  }
+
   def __init__(self, path, names):
     """Open specified file and initialise reserved words and IDs."""
-    self.__path = path
     self.__names = names
     self.__done = False
+    with open(path, 'r') as f:
+      source = f.read()
+    self.__lines = source.split("\n")
 
     def symbol_gen():
-      with open(path, 'r') as f:
-        for line in f:
-          loc = 0
-          for w in re.split(r"(\.|,|\(|\)| +|=)", line):
-            s = w.lower().strip()
-
-            if s != "":
-              type = self.get_symbol_type(s)
-              [id] = self.__names.lookup([s])
-
-              yield Symbol(type=type, id=id, loc=loc)
-
-            loc += len(w)
-          yield Symbol(type=self.EOL, loc=loc)
-        yield Symbol(type=self.EOF)
+      # Name IDs already fetched from self.__names, keyed by string.
+      name_ids = {}
+      # Offset of the first character of the current line in the source.
+      line_start = 0
+
+      for m in TOKEN_RE.finditer(source.lower()):
+        group = m.lastgroup
+        if group is None:
+          continue
+
+        loc = m.start() - line_start
+
+        if group == "EOL":
+          yield Symbol(self.EOL, None, loc)
+          line_start = m.end()
+        elif group == "NUMBER":
+          yield Symbol(self.NUMBER, None, loc, int(m.group()),
+                       m.start("ZERO") != -1)
+        elif group == "INVALID":
+          # Stray characters are reported, never interned in names.
+          yield Symbol(self.INVALID, None, loc)
+        else:
+          s = m.group()
+          if group == "PUNCTUATION":
+            type = self._PUNCTUATION[s]
+          else:
+            type = self._KEYWORDS.get(s, self.NAME)
+
+          id = name_ids.get(s)
+          if id is None:
+            [id] = self.__names.lookup([s])
+            name_ids[s] = id
+          yield Symbol(type, id, loc)
+
+      # The last line may not end with a newline.
+      if line_start < len(source):
+        yield Symbol(self.EOL, None, len(source) - line_start)
+      yield Symbol(self.EOF)
 
     self.__symbols = symbol_gen()
 
   def get_line(self, number):
-    line = None
-    with open(self.__path, 'r') as f:
-      for _ in range(number):
-        line = next(f)
-    return line.strip()
+    return self.__lines[number - 1].strip()
   
-  def get_symbol_type(self, w):
-    if w == "clk":
-      return self.CLOCK
-    if w == "sw":
-      return self.SWITCH
-    if w == "and":
-      return self.AND
-    if w == "or":
-      return self.OR
-    if w == "nand":
-      return self.NAND
-    if w == "nor":
-      return self.NOR
-    if w == "dtype":
-      return self.DTYPE
-    if w == "xor":
-      return self.XOR
-    if w == '.':
-      return self.DOT
-    if w == ',':
-      return self.COMMA
-    if w == '(':
-      return self.OPEN
-    if w == ')':
-      return self.CLOSE
-    if w == ' ':
-      return self.WHITESPACE
-    if w == '=':
-      return self.EQUALS
-    if w == '':
-      return self.EOL
-    if w == 'monitor':
-      return self.MONITOR
-    # if re.match(r"^[a-zA-Z_]{1}\w*$", w):
-    #   return self.NAME
-    if w.isdigit():
-      return self.NUMBER
-    return self.NAME
-
   def get_symbol(self):
-    """Translate the next sequence of characters into a symbol."""
+    """Return the next symbol in the definition file."""
     return next(self.__symbols)
@@ -0,0 +1,132 @@
+"""Test the parse module."""
+import pytest
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+from scanner import Scanner
+from parse import Parser
+
+
+@pytest.fixture
+def parse_text(tmp_path):
+    """Return a function that parses the given file text.
+
+    The function returns the result of parse_network and the Names, Devices,
+    Network and Monitors instances that were built.
+    """
+    def parse(text, newline="\n"):
+        path = tmp_path / "definition.txt"
+        with open(path, "w", newline=newline) as f:
+            f.write(text)
+        names = Names()
+        devices = Devices(names)
+        network = Network(names, devices)
+        monitors = Monitors(names, devices, network)
+        scanner = Scanner(str(path), names)
+        parser = Parser(names, devices, network, monitors, scanner)
+        return parser.parse_network(), names, devices, network, monitors
+    return parse
+
+
+def error_report(message, line_number, line, loc=None):
+    """Return the text parse_network prints for a parsing error."""
+    prefix = f"{line_number} "
+    report = f"{message}\n\n{prefix} {line}\n"
+    if loc is not None:
+        report += " " * len(prefix) + " " + " " * loc + "^\n"
+    return report
+
+
+def test_parse_valid_network(parse_text):
+    """Test that a valid definition file builds the network."""
+    result, names, devices, network, monitors = parse_text(
+        "AND a(2), b(3)\n"
+        "xor x\n"
+        "sw s1(0), s2(1)\n"
+        "clk c(5)\n"
+        "\n"
+        "s1 = a.i1\n"
+        "s2 = a.i2\n"
+        "c = x.i1\n"
+        "monitor a, x")
+    assert result
+
+    [A_ID, B_ID, X_ID, S1_ID, S2_ID, C_ID, I1, I2] = names.lookup(
+        ["a", "b", "x", "s1", "s2", "c", "i1", "i2"])
+
+    assert devices.get_device(A_ID).device_kind == devices.AND
+    assert len(devices.get_device(B_ID).inputs) == 3
+    assert devices.get_device(X_ID).device_kind == devices.XOR
+    assert devices.get_device(S1_ID).switch_state == devices.LOW
+    assert devices.get_device(S2_ID).switch_state == devices.HIGH
+    assert devices.get_device(C_ID).clock_half_period == 5
+
+    assert network.get_connected_output(A_ID, I1) == (S1_ID, None)
+    assert network.get_connected_output(A_ID, I2) == (S2_ID, None)
+    assert network.get_connected_output(X_ID, I1) == (C_ID, None)
+
+    assert (A_ID, None) in monitors.monitors_dictionary
+    assert (X_ID, None) in monitors.monitors_dictionary
+
+
+def test_parse_tab_separated(parse_text):
+    """Test that tabs separate symbols like spaces do."""
+    result, names, devices, network, monitors = parse_text("and\ta(2)\n")
+    assert result
+
+
+@pytest.mark.parametrize("text, report", [
+    ("and g(0)\n", error_report("Expecting a number > 0", 1, "and g(0)", 6)),
+    ("and g(02)\n",
+     error_report("Expecting a number > 0", 1, "and g(02)", 6)),
+    ("and g(17)\n",
+     error_report("Expecting a number from 1-16", 1, "and g(17)", 6)),
+    ("and g(2a)\n",
+     error_report("Expecting close bracket", 1, "and g(2a)", 7)),
+    ("and g 2)\n", error_report("Expecting open bracket", 1, "and g 2)", 6)),
+    ("and g(2\n", error_report("Expecting close bracket", 1, "and g(2", 7)),
+    ("and g(2) x\n", error_report("Expecting ','", 1, "and g(2) x", 9)),
+    ("and 9(2)\n",
+     error_report("Expecting user-defined name", 1, "and 9(2)", 4)),
+    ("and a-b(2)\n",
+     error_report("Expecting open bracket", 1, "and a-b(2)", 5)),
+    ("sw s(2)\n", error_report("Expecting 0 or 1", 1, "sw s(2)", 5)),
+    ("clk c(07)\n", error_report("Expecting a number > 0", 1, "clk c(07)", 6)),
+    ("clk c(0)\n", error_report("Expecting a number > 0", 1, "clk c(0)", 6)),
+    ("and a(2)\nmonitor zz\n",
+     error_report("Undeclared device", 2, "monitor zz")),
+    ("and a(2)\na . = b\n",
+     error_report("Expecting port name", 2, "a . = b", 4)),
+    ("and a(2)\na b\n", error_report("Expecting . or =", 2, "a b", 2)),
+    ("and a(2)\na.i1 b\n", error_report("Expecting '='", 2, "a.i1 b", 5)),
+    ("sw s(1)\nand g(2)\ns = g.i1 x\n",
+     error_report("Expecting EOL", 3, "s = g.i1 x", 9)),
+    ("sw s(1)\nand g(2)\ns = g,\n",
+     error_report("Expecting '.'", 3, "s = g,", 5)),
+    ("sw s(1)\nand g(2)\ns = g.i1\ns = g\n",
+     error_report("Network error", 4, "s = g")),
+    ("@ and a(2)\n",
+     error_report("Unexpected character", 1, "@ and a(2)", 0)),
+    ("$\n", error_report("Unexpected character", 1, "$", 0)),
+    ("and a(2)\n@", error_report("Unexpected character", 2, "@", 0)),
+    ("$ and a(2)\nand b(0)",
+     error_report("Unexpected character", 1, "$ and a(2)", 0)),
+    ("12 and a(2)\n",
+     error_report("Unexpected symbol", 1, "12 and a(2)", 0)),
+])
+def test_parsing_errors(parse_text, capsys, text, report):
+    """Test the message, line and caret printed for each parsing error."""
+    result, names, devices, network, monitors = parse_text(text)
+    assert not result
+    assert capsys.readouterr().out == report
+
+
+def test_parsing_error_crlf(parse_text, capsys):
+    """Test that CRLF files report errors like LF files."""
+    result, names, devices, network, monitors = parse_text(
+        "sw s(1)\nand g(0)\n", newline="\r\n")
+    assert not result
+    assert capsys.readouterr().out == error_report(
+        "Expecting a number > 0", 2, "and g(0)", 6)
@@ -0,0 +1,185 @@
+"""Test the scanner module."""
+import pytest
+
+from names import Names
+from scanner import Scanner
+
+
+@pytest.fixture
+def make_scanner(tmp_path):
+    """Return a function that builds a Scanner over the given file text."""
+    def make(text, newline="\n"):
+        path = tmp_path / "definition.txt"
+        with open(path, "w", newline=newline) as f:
+            f.write(text)
+        names = Names()
+        return Scanner(str(path), names), names
+    return make
+
+
+def get_symbols(scanner):
+    """Return every symbol up to and including EOF."""
+    symbols = []
+    while True:
+        symbol = scanner.get_symbol()
+        symbols.append(symbol)
+        if symbol.type == Scanner.EOF:
+            return symbols
+
+
+def types_and_locs(symbols):
+    """Return the (type, loc) pair of each symbol."""
+    return [(symbol.type, symbol.loc) for symbol in symbols]
+
+
+def test_declaration_symbols(make_scanner):
+    """Test the type, ID, location and value of each symbol on a line."""
+    scanner, names = make_scanner("and a(2)\n")
+    symbols = get_symbols(scanner)
+
+    assert types_and_locs(symbols) == [(Scanner.AND, 0),
+                                       (Scanner.NAME, 4),
+                                       (Scanner.OPEN, 5),
+                                       (Scanner.NUMBER, 6),
+                                       (Scanner.CLOSE, 7),
+                                       (Scanner.EOL, 8),
+                                       (Scanner.EOF, None)]
+
+    [A_ID] = names.lookup(["a"])
+    assert symbols[1].id == A_ID
+
+    number = symbols[3]
+    assert number.value == 2
+    assert not number.leading_zero
+    assert number.id is None
+
+
+def test_punctuation(make_scanner):
+    """Test that each punctuation character gets its own symbol type."""
+    scanner, names = make_scanner(". , ( ) =")
+    assert [symbol.type for symbol in get_symbols(scanner)] == [
+        Scanner.DOT, Scanner.COMMA, Scanner.OPEN, Scanner.CLOSE,
+        Scanner.EQUALS, Scanner.EOL, Scanner.EOF]
+
+
+@pytest.mark.parametrize("word, symbol_type", [
+    ("clk", Scanner.CLOCK),
+    ("sw", Scanner.SWITCH),
+    ("and", Scanner.AND),
+    ("or", Scanner.OR),
+    ("nand", Scanner.NAND),
+    ("nor", Scanner.NOR),
+    ("dtype", Scanner.DTYPE),
+    ("xor", Scanner.XOR),
+    ("monitor", Scanner.MONITOR),
+    ("MONITOR", Scanner.MONITOR),
+    ("sw1", Scanner.NAME),
+    ("android", Scanner.NAME),
+    ("or_x", Scanner.NAME),
+    ("_a", Scanner.NAME),
+])
+def test_keywords(make_scanner, word, symbol_type):
+    """Test that only whole reserved words are keywords."""
+    scanner, names = make_scanner(word)
+    assert scanner.get_symbol().type == symbol_type
+
+
+def test_names_are_lowercased(make_scanner):
+    """Test that names are case-insensitive."""
+    scanner, names = make_scanner("Sw1 SW1")
+    [SW1_ID] = names.lookup(["sw1"])
+    first, second = scanner.get_symbol(), scanner.get_symbol()
+    assert first.id == second.id == SW1_ID
+
+
+@pytest.mark.parametrize("text, value, leading_zero", [
+    ("0", 0, True),
+    ("07", 7, True),
+    ("10", 10, False),
+    ("1", 1, False),
+])
+def test_numbers(make_scanner, text, value, leading_zero):
+    """Test that numbers carry their value and a leading zero flag."""
+    scanner, names = make_scanner(text)
+    symbol = scanner.get_symbol()
+    assert symbol.type == Scanner.NUMBER
+    assert symbol.value == value
+    assert symbol.leading_zero == leading_zero
+
+    # Numbers are not added to the names table
+    assert names.query(text) is None
+
+
+def test_tabs_separate_symbols(make_scanner):
+    """Test that tabs and runs of spaces separate symbols."""
+    scanner, names = make_scanner("and\ta  (2)")
+    assert types_and_locs(get_symbols(scanner)) == [(Scanner.AND, 0),
+                                                    (Scanner.NAME, 4),
+                                                    (Scanner.OPEN, 7),
+                                                    (Scanner.NUMBER, 8),
+                                                    (Scanner.CLOSE, 9),
+                                                    (Scanner.EOL, 10),
+                                                    (Scanner.EOF, None)]
+
+
+def test_number_followed_by_name(make_scanner):
+    """Test that a digit run followed by letters is NUMBER then NAME."""
+    scanner, names = make_scanner("2a")
+    assert types_and_locs(get_symbols(scanner)) == [(Scanner.NUMBER, 0),
+                                                    (Scanner.NAME, 1),
+                                                    (Scanner.EOL, 2),
+                                                    (Scanner.EOF, None)]
+
+
+def test_invalid_characters(make_scanner):
+    """Test that characters outside the grammar are INVALID symbols."""
+    scanner, names = make_scanner("a-b @")
+    symbols = get_symbols(scanner)
+    assert types_and_locs(symbols) == [(Scanner.NAME, 0),
+                                       (Scanner.INVALID, 1),
+                                       (Scanner.NAME, 2),
+                                       (Scanner.INVALID, 4),
+                                       (Scanner.EOL, 5),
+                                       (Scanner.EOF, None)]
+
+    # Invalid characters are not added to the names table
+    assert symbols[1].id is None
+    assert names.query("-") is None
+    assert names.query("@") is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("", [(Scanner.EOF, None)]),
+    ("\n", [(Scanner.EOL, 0), (Scanner.EOF, None)]),
+    ("a\nbc\n", [(Scanner.NAME, 0), (Scanner.EOL, 1),
+                 (Scanner.NAME, 0), (Scanner.EOL, 2),
+                 (Scanner.EOF, None)]),
+    ("a\nbc", [(Scanner.NAME, 0), (Scanner.EOL, 1),
+               (Scanner.NAME, 0), (Scanner.EOL, 2),
+               (Scanner.EOF, None)]),
+    ("a\n\nb", [(Scanner.NAME, 0), (Scanner.EOL, 1),
+                (Scanner.EOL, 0),
+                (Scanner.NAME, 0), (Scanner.EOL, 1),
+                (Scanner.EOF, None)]),
+])
+def test_line_ends(make_scanner, text, expected):
+    """Test EOL and EOF with and without a trailing newline."""
+    scanner, names = make_scanner(text)
+    assert types_and_locs(get_symbols(scanner)) == expected
+
+
+def test_crlf_line_ends(make_scanner):
+    """Test that CRLF files scan the same as LF files."""
+    text = "and a(2)\nsw s(1)\n"
+    lf_scanner, lf_names = make_scanner(text)
+    crlf_scanner, crlf_names = make_scanner(text, newline="\r\n")
+
+    assert (get_symbols(crlf_scanner) == get_symbols(lf_scanner))
+    assert crlf_scanner.get_line(1) == "and a(2)"
+
+
+def test_get_line(make_scanner):
+    """Test that get_line returns the stripped original line."""
+    scanner, names = make_scanner("AND a(2)\n  sw s(1)  \n")
+    assert scanner.get_line(1) == "AND a(2)"
+    assert scanner.get_line(2) == "sw s(1)"